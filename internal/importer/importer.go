@@ -19,6 +19,10 @@ const (
 	insertBatchSize = 5000
 	colCount        = 11
 
+	// Number of read batches that can be queued up while
+	// a previous batch is being inserted into the DB.
+	insertQueueSize = 4
+
 	typeEntry = "-"
 	typeDef   = "^"
 )
@@ -76,22 +80,63 @@ func New(langs data.LangMap, stmtInsertEntry *sqlx.Stmt, stmtInsertRel *sqlx.Stm
 	}
 }
 
-// Import imports a CSV file into the DB.
+// Import imports a CSV file into the DB. The file is read and validated in
+// a separate goroutine that queues batches of entries while the previous
+// batches are being inserted into the DB.
 func (im *Importer) Import(filePath string) error {
 	fp, err := os.Open(filePath)
 	if err != nil {
 		return fmt.Errorf("error opening file %s: %v", filePath, err)
 	}
+	defer fp.Close()
+
+	var (
+		batches = make(chan []entry, insertQueueSize)
+		done    = make(chan struct{})
+		readErr = make(chan error, 1)
+	)
+	go func() {
+		defer close(batches)
+		readErr <- im.readBatches(fp, filePath, batches, done)
+	}()
 
 	var (
-		// Holds all main entries.
-		entries []entry
-		n       = 0
 		numMain = 0
 		numDefs = 0
 	)
+	for entries := range batches {
+		if err := im.insertEntries(entries, numMain); err != nil {
+			close(done)
+			return fmt.Errorf("error inserting entries to DB: %v", err)
+		}
+
+		numMain += len(entries)
+		for _, e := range entries {
+			numDefs += len(e.defs)
+		}
+
+		im.lo.Printf("imported %d entries and %d definitions", numMain, numDefs)
+	}
+
+	if err := <-readErr; err != nil {
+		return err
+	}
+
+	im.lo.Printf("finished. imported %d entries and %d definitions", numMain, numDefs)
+	return nil
+}
+
+// readBatches reads entries from the CSV and sends them to ch in batches of
+// insertBatchSize main entries along with their definitions. It stops
+// if done is closed.
+func (im *Importer) readBatches(r io.Reader, filePath string, ch chan<- []entry, done <-chan struct{}) error {
+	var (
+		// Holds all main entries.
+		entries = make([]entry, 0, insertBatchSize)
+		n       = 0
+	)
 
-	rd := csv.NewReader(fp)
+	rd := csv.NewReader(r)
 	rd.FieldsPerRecord = -1
 	for {
 		row, err := rd.Read()
@@ -123,20 +168,18 @@ func (im *Importer) Import(filePath string) error {
 		if e.Type == typeDef {
 			i := len(entries) - 1
 			entries[i].defs = append(entries[i].defs, e)
-			numDefs++
 			continue
 		}
 
-		// On hitting the batchsize, insert to DB.
+		// On hitting the batchsize, queue the batch for insertion.
 		if len(entries)%insertBatchSize == 0 {
-			if err := im.insertEntries(entries, numMain); err != nil {
-				return fmt.Errorf("error inserting entries to DB: %v", err)
+			select {
+			case ch <- entries:
+			case <-done:
+				return nil
 			}
 
-			numMain += len(entries)
-			entries = []entry{}
-
-			im.lo.Printf("imported %d entries and %d definitions", numMain, numDefs)
+			entries = make([]entry, 0, insertBatchSize)
 		}
 
 		// New main entry.
@@ -144,12 +187,12 @@ func (im *Importer) Import(filePath string) error {
 	}
 
 	if len(entries) > 0 {
-		if err := im.insertEntries(entries, numMain); err != nil {
-			return fmt.Errorf("error inserting entries to DB: %v", err)
+		select {
+		case ch <- entries:
+		case <-done:
 		}
 	}
 
-	im.lo.Printf("finished. imported %d entries and %d definitions", numMain+len(entries), numDefs)
 	return nil
 }
 
@@ -223,19 +266,25 @@ func (im *Importer) readEntry(r []string) (entry, error) {
 	return e, nil
 }
 
+// insertEntries inserts a batch of main entries, their definitions, and
+// the relations between them in a single transaction.
 func (im *Importer) insertEntries(entries []entry, lineStart int) error {
-	var (
-		tx   *sqlx.Tx
-		stmt *sqlx.Stmt
-		err  error
-	)
+	tx, err := im.db.Beginx()
+	if err != nil {
+		return err
+	}
+	defer tx.Rollback()
 
-	// Insert entries.
-	entryIDs := make([]int, len(entries))
-	if tx, err = im.db.Beginx(); err != nil {
+	// Don't wait for the WAL flush on every batch commit. A crash can only lose
+	// the last few committed batches (never corrupt them), and as the insert
+	// queries skip existing entries and relations, re-running the import recovers.
+	if _, err := tx.Exec(`SET LOCAL synchronous_commit = off`); err != nil {
 		return err
 	}
-	stmt = tx.Stmtx(im.stmtInsertEntry)
+
+	// Insert entries.
+	entryIDs := make([]int, len(entries))
+	stmt := tx.Stmtx(im.stmtInsertEntry)
 	for i, e := range entries {
 		if err := stmt.Get(&entryIDs[i],
 			e.Content,
@@ -255,26 +304,13 @@ func (im *Importer) insertEntries(entries []entry, lineStart int) error {
 		lineStart++
 	}
 
-	if err := tx.Commit(); err != nil {
-		return err
-	}
-
-	// Insert definition entries and collect their IDs for every main entry.
-	relIDs := make([][]int, len(entries))
-
-	if tx, err = im.db.Beginx(); err != nil {
-		return err
-	}
-	stmt = tx.Stmtx(im.stmtInsertEntry)
-
-	// Iterate through all main entries again, inserting their definition entries.
+	// Iterate through all main entries again, inserting their definition entries
+	// and relating each one to its main entry as soon as its ID is known.
+	relStmt := tx.Stmtx(im.stmtInsertRel)
 	for i, mainEntry := range entries {
-		relIDs[i] = make([]int, len(mainEntry.defs))
-
 		for j, e := range mainEntry.defs {
-			// Insert the definition entry and record the resulting ID
-			// against the parent ID.
-			if err := stmt.Get(&relIDs[i][j],
+			var defID int
+			if err := stmt.Get(&defID,
 				e.Content,
 				e.Initial,
 				i+j,
@@ -288,31 +324,14 @@ func (im *Importer) insertEntries(entries []entry, lineStart int) error {
 				data.StatusEnabled); err != nil {
 				return err
 			}
-		}
-	}
 
-	if err := tx.Commit(); err != nil {
-		return err
-	}
-
-	// Insert relationships.
-	if tx, err = im.db.Beginx(); err != nil {
-		return err
-	}
-	stmt = tx.Stmtx(im.stmtInsertRel)
-	for i, defIDs := range relIDs {
-		for j, toID := range defIDs {
-			d := entries[i].defs[j]
-			if _, err := stmt.Exec(entryIDs[i], toID, pq.StringArray(d.DefTypes), pq.StringArray(d.Tags), d.Notes, j, data.StatusEnabled); err != nil {
+			if _, err := relStmt.Exec(entryIDs[i], defID, pq.StringArray(e.DefTypes), pq.StringArray(e.Tags), e.Notes, j, data.StatusEnabled); err != nil {
 				return err
 			}
 		}
 	}
-	if err := tx.Commit(); err != nil {
-		return err
-	}
 
-	return nil
+	return tx.Commit()
 }
 
 func cleanString(s string) string {